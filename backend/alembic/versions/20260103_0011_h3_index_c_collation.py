@@ -0,0 +1,46 @@
+"""Use byte-wise "C" collation for h3_index columns.
+
+Revision ID: 20260103_0011
+Revises: 20251230_0010
+Create Date: 2026-01-03
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers
+revision: str = "20260103_0011"
+down_revision: Union[str, None] = "20251230_0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # H3 indexes are hex strings; "C" collation keeps their ordering but
+    # turns every join/index comparison into a plain memcmp.
+    op.drop_constraint("user_cell_visits_h3_index_fkey", "user_cell_visits", type_="foreignkey")
+    op.execute('ALTER TABLE h3_cells ALTER COLUMN h3_index TYPE VARCHAR(25) COLLATE "C"')
+    op.execute('ALTER TABLE user_cell_visits ALTER COLUMN h3_index TYPE VARCHAR(25) COLLATE "C"')
+    op.create_foreign_key(
+        "user_cell_visits_h3_index_fkey",
+        "user_cell_visits",
+        "h3_cells",
+        ["h3_index"],
+        ["h3_index"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("user_cell_visits_h3_index_fkey", "user_cell_visits", type_="foreignkey")
+    op.execute('ALTER TABLE user_cell_visits ALTER COLUMN h3_index TYPE VARCHAR(25) COLLATE "default"')
+    op.execute('ALTER TABLE h3_cells ALTER COLUMN h3_index TYPE VARCHAR(25) COLLATE "default"')
+    op.create_foreign_key(
+        "user_cell_visits_h3_index_fkey",
+        "user_cell_visits",
+        "h3_cells",
+        ["h3_index"],
+        ["h3_index"],
+        ondelete="CASCADE",
+    )
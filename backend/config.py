@@ -10,6 +10,11 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 REFRESH_TOKEN_EXPIRE_DAYS = 14
 
+# Password hashing
+# bcrypt work factor; production keeps the library default. The test suite
+# lowers it (see tests/conftest.py) since it only needs correctness.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
 # Email Configuration (SendGrid)
 SENDGRID_API_KEY = os.getenv("SENDGRID_API_KEY")
 SENDGRID_FROM_EMAIL = os.getenv("SENDGRID_FROM_EMAIL", "noreply@trekkr.app")
@@ -33,6 +38,9 @@ def validate_config() -> None:
     elif len(SECRET_KEY) < 32:
         errors.append("SECRET_KEY must be at least 32 characters in production")
 
+    if BCRYPT_ROUNDS < 12:
+        errors.append("BCRYPT_ROUNDS must be at least 12 in production")
+
     if not SENDGRID_API_KEY:
         errors.append("SENDGRID_API_KEY must be set in production")
 
@@ -95,7 +95,7 @@ ALTER SEQUENCE public.devices_id_seq OWNED BY public.devices.id;
 --
 
 CREATE TABLE public.h3_cells (
-    h3_index character varying(25) NOT NULL,
+    h3_index character varying(25) COLLATE pg_catalog."C" NOT NULL,
     res smallint NOT NULL,
     country_id integer,
     state_id integer,
@@ -292,7 +292,7 @@ CREATE TABLE public.user_cell_visits (
     id integer NOT NULL,
     user_id integer NOT NULL,
     device_id integer,
-    h3_index character varying(25) NOT NULL,
+    h3_index character varying(25) COLLATE pg_catalog."C" NOT NULL,
     res smallint NOT NULL,
     first_visited_at timestamp without time zone DEFAULT CURRENT_TIMESTAMP NOT NULL,
     last_visited_at timestamp without time zone DEFAULT CURRENT_TIMESTAMP NOT NULL,
@@ -33,6 +33,12 @@ def _geom_column(geom_type: str, srid: int = 4326):
         return Geometry(geom_type, srid=srid)
 
 
+# H3 indexes are fixed-width hex strings, so byte-wise "C" collation orders
+# them identically to the locale default while making the h3_cells <->
+# user_cell_visits join and its indexes compare with memcmp instead of strcoll.
+H3IndexType = String(25).with_variant(String(25, collation="C"), "postgresql")
+
+
 class CountryRegion(Base):
     """Country catalog with geometry and estimated land cell totals.
 
@@ -115,7 +121,7 @@ class H3Cell(Base):
         Index("ix_h3_cells_res", "res"),
     )
 
-    h3_index = Column(String(25), primary_key=True)
+    h3_index = Column(H3IndexType, primary_key=True)
     res = Column(SmallInteger, nullable=False)  # Indexed via __table_args__
     country_id = Column(
         Integer,
@@ -9,12 +9,12 @@ from sqlalchemy import (
     Index,
     Integer,
     SmallInteger,
-    String,
     UniqueConstraint,
 )
 from sqlalchemy.orm import relationship, backref
 
 from database import Base
+from models.geo import H3IndexType
 
 
 class UserCellVisit(Base):
@@ -40,7 +40,7 @@ class UserCellVisit(Base):
         index=True,
     )
     h3_index = Column(
-        String(25),
+        H3IndexType,
         ForeignKey("h3_cells.h3_index", ondelete="CASCADE"),
         nullable=False,
         index=True,  # Added explicit index for FK lookups
@@ -11,6 +11,7 @@ from sqlalchemy.orm import Session
 from config import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
     ALGORITHM,
+    BCRYPT_ROUNDS,
     REFRESH_TOKEN_EXPIRE_DAYS,
     SECRET_KEY,
 )
@@ -36,7 +37,7 @@ def _bcrypt_input(password: str) -> bytes:
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(_bcrypt_input(password), salt)
     return hashed.decode("utf-8")
 
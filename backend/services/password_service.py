@@ -15,6 +15,11 @@ from services.email_service import EmailService
 RESET_TOKEN_EXPIRY_HOURS = 1
 
 
+def hash_reset_token(raw_token: str) -> str:
+    """Return the SHA-256 hex digest stored for a raw reset token."""
+    return hashlib.sha256(raw_token.encode()).hexdigest()
+
+
 class PasswordService:
     """Handles password change, forgot, and reset operations."""
 
@@ -55,7 +60,7 @@ class PasswordService:
             return  # Silent fail
 
         raw_token = secrets.token_urlsafe(32)
-        token_hash = hashlib.sha256(raw_token.encode()).hexdigest()
+        token_hash = hash_reset_token(raw_token)
 
         # Clean up expired tokens globally (prevents unbounded table growth)
         self.db.query(PasswordResetToken).filter(
@@ -89,7 +94,7 @@ class PasswordService:
         Returns True on success, False if token invalid/expired/used.
         Increments token_version to invalidate all existing sessions.
         """
-        token_hash = hashlib.sha256(raw_token.encode()).hexdigest()
+        token_hash = hash_reset_token(raw_token)
 
         reset_token = (
             self.db.query(PasswordResetToken)
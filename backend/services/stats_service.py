@@ -8,6 +8,52 @@ from sqlalchemy.orm import Session
 from models.user import User
 
 
+# Integer keys for the parameterized ORDER BY; keeps the SQL text identical
+# across every sort variant so the statement can be cached and reused.
+_SORT_KEYS = {
+    "coverage_pct": 1,
+    "first_visited_at": 2,
+    "last_visited_at": 3,
+    "name": 4,
+}
+_ORDER_KEYS = {"asc": 0, "desc": 1}
+
+
+def _order_by_clause(coverage_expr: str, name_expr: str) -> str:
+    """Build a static ORDER BY that branches on :sort_key and :order_key.
+
+    Each (field, direction) pair gets its own CASE so that columns of
+    different types are never mixed; non-matching CASEs evaluate to NULL
+    for every row and have no effect on the ordering.
+    """
+    fields = {
+        "coverage_pct": coverage_expr,
+        "first_visited_at": "MIN(ucv.first_visited_at)",
+        "last_visited_at": "MAX(ucv.last_visited_at)",
+        "name": name_expr,
+    }
+    terms = []
+    for field, expr in fields.items():
+        sort_key = _SORT_KEYS[field]
+        for order, order_key in _ORDER_KEYS.items():
+            direction = order.upper()
+            terms.append(
+                f"CASE WHEN :sort_key = {sort_key} AND :order_key = {order_key} "
+                f"THEN {expr} END {direction}"
+            )
+    return ",\n                ".join(terms)
+
+
+_COUNTRIES_ORDER_BY = _order_by_clause(
+    "(COUNT(ucv.id)::float / COALESCE(c.land_cells_total_resolution8, 1))",
+    "c.name",
+)
+_REGIONS_ORDER_BY = _order_by_clause(
+    "(COUNT(ucv.id)::float / COALESCE(s.land_cells_total_resolution8, 1))",
+    "s.name",
+)
+
+
 class StatsService:
     """Service for stats-related queries."""
 
@@ -23,15 +69,8 @@ class StatsService:
         offset: int = 0,
     ) -> dict:
         """Get countries the user has visited with coverage statistics."""
-        # Validate sort_by to prevent SQL injection
-        valid_sort_fields = {
-            "coverage_pct": "(COUNT(ucv.id)::float / COALESCE(c.land_cells_total_resolution8, 1))",
-            "first_visited_at": "first_visited_at",
-            "last_visited_at": "last_visited_at",
-            "name": "c.name",
-        }
-        sort_field = valid_sort_fields.get(sort_by, "last_visited_at")
-        order_dir = "DESC" if order == "desc" else "ASC"
+        sort_key = _SORT_KEYS.get(sort_by, _SORT_KEYS["last_visited_at"])
+        order_key = _ORDER_KEYS["desc"] if order == "desc" else _ORDER_KEYS["asc"]
 
         # Get total count first
         count_query = text("""
@@ -43,13 +82,16 @@ class StatsService:
         """)
         total = self.db.execute(count_query, {"user_id": self.user_id}).scalar() or 0
 
-        # Get paginated results with coverage
+        # Get paginated results; coverage is computed and rounded in SQL
         data_query = text(f"""
             SELECT
                 c.iso2 AS code,
                 c.name,
-                COUNT(ucv.id) AS cells_visited,
-                COALESCE(c.land_cells_total_resolution8, 1) AS cells_total,
+                CASE
+                    WHEN COALESCE(c.land_cells_total_resolution8, 1) > 0
+                    THEN ROUND(COUNT(ucv.id)::numeric / COALESCE(c.land_cells_total_resolution8, 1), 6)
+                    ELSE 0
+                END::float AS coverage_pct,
                 MIN(ucv.first_visited_at) AS first_visited_at,
                 MAX(ucv.last_visited_at) AS last_visited_at
             FROM user_cell_visits ucv
@@ -57,23 +99,25 @@ class StatsService:
             JOIN regions_country c ON hc.country_id = c.id
             WHERE ucv.user_id = :user_id AND ucv.res = 8
             GROUP BY c.id, c.iso2, c.name, c.land_cells_total_resolution8
-            ORDER BY {sort_field} {order_dir}
+            ORDER BY
+                {_COUNTRIES_ORDER_BY}
             LIMIT :limit OFFSET :offset
         """)
 
         rows = self.db.execute(data_query, {
             "user_id": self.user_id,
+            "sort_key": sort_key,
+            "order_key": order_key,
             "limit": limit,
             "offset": offset,
         }).fetchall()
 
         countries = []
         for row in rows:
-            coverage_pct = row.cells_visited / row.cells_total if row.cells_total > 0 else 0.0
             countries.append({
                 "code": row.code,
                 "name": row.name,
-                "coverage_pct": round(coverage_pct, 6),
+                "coverage_pct": row.coverage_pct,
                 "first_visited_at": row.first_visited_at,
                 "last_visited_at": row.last_visited_at,
             })
@@ -91,15 +135,8 @@ class StatsService:
         offset: int = 0,
     ) -> dict:
         """Get regions/states the user has visited with coverage statistics."""
-        # Validate sort_by to prevent SQL injection
-        valid_sort_fields = {
-            "coverage_pct": "(COUNT(ucv.id)::float / COALESCE(s.land_cells_total_resolution8, 1))",
-            "first_visited_at": "first_visited_at",
-            "last_visited_at": "last_visited_at",
-            "name": "s.name",
-        }
-        sort_field = valid_sort_fields.get(sort_by, "last_visited_at")
-        order_dir = "DESC" if order == "desc" else "ASC"
+        sort_key = _SORT_KEYS.get(sort_by, _SORT_KEYS["last_visited_at"])
+        order_key = _ORDER_KEYS["desc"] if order == "desc" else _ORDER_KEYS["asc"]
 
         # Get total count first
         count_query = text("""
@@ -111,15 +148,18 @@ class StatsService:
         """)
         total = self.db.execute(count_query, {"user_id": self.user_id}).scalar() or 0
 
-        # Get paginated results with coverage
+        # Get paginated results; coverage is computed and rounded in SQL
         data_query = text(f"""
             SELECT
                 CONCAT(c.iso2, '-', s.code) AS code,
                 s.name,
                 c.iso2 AS country_code,
                 c.name AS country_name,
-                COUNT(ucv.id) AS cells_visited,
-                COALESCE(s.land_cells_total_resolution8, 1) AS cells_total,
+                CASE
+                    WHEN COALESCE(s.land_cells_total_resolution8, 1) > 0
+                    THEN ROUND(COUNT(ucv.id)::numeric / COALESCE(s.land_cells_total_resolution8, 1), 6)
+                    ELSE 0
+                END::float AS coverage_pct,
                 MIN(ucv.first_visited_at) AS first_visited_at,
                 MAX(ucv.last_visited_at) AS last_visited_at
             FROM user_cell_visits ucv
@@ -128,25 +168,27 @@ class StatsService:
             JOIN regions_country c ON s.country_id = c.id
             WHERE ucv.user_id = :user_id AND ucv.res = 8
             GROUP BY s.id, s.code, s.name, s.land_cells_total_resolution8, c.id, c.iso2, c.name
-            ORDER BY {sort_field} {order_dir}
+            ORDER BY
+                {_REGIONS_ORDER_BY}
             LIMIT :limit OFFSET :offset
         """)
 
         rows = self.db.execute(data_query, {
             "user_id": self.user_id,
+            "sort_key": sort_key,
+            "order_key": order_key,
             "limit": limit,
             "offset": offset,
         }).fetchall()
 
         regions = []
         for row in rows:
-            coverage_pct = row.cells_visited / row.cells_total if row.cells_total > 0 else 0.0
             regions.append({
                 "code": row.code,
                 "name": row.name,
                 "country_code": row.country_code,
                 "country_name": row.country_name,
-                "coverage_pct": round(coverage_pct, 6),
+                "coverage_pct": row.coverage_pct,
                 "first_visited_at": row.first_visited_at,
                 "last_visited_at": row.last_visited_at,
             })
@@ -165,8 +207,8 @@ class StatsService:
         Returns:
             dict with keys: user, stats, recent_countries, recent_regions
         """
-        # Fetch user info
-        user = self.db.query(User).filter(User.id == self.user_id).first()
+        # Fetch user info (identity map hit when auth already loaded it)
+        user = self.db.get(User, self.user_id)
         if not user:
             raise ValueError(f"User {self.user_id} not found")
 
@@ -209,41 +251,62 @@ class StatsService:
 
         stats_row = self.db.execute(stats_query, {"user_id": self.user_id}).fetchone()
 
-        # Fetch recent countries
-        countries_query = text("""
-            SELECT
-              rc.iso2 as code,
-              rc.name,
-              MAX(ucv.last_visited_at) as visited_at
-            FROM user_cell_visits ucv
-            JOIN h3_cells hc ON ucv.h3_index = hc.h3_index
-            JOIN regions_country rc ON hc.country_id = rc.id
-            WHERE ucv.user_id = :user_id AND ucv.res = 8
-            GROUP BY rc.id, rc.iso2, rc.name
-            ORDER BY visited_at DESC
-            LIMIT 3
-        """)
-
-        countries_rows = self.db.execute(countries_query, {"user_id": self.user_id}).fetchall()
-
-        # Fetch recent regions
-        regions_query = text("""
-            SELECT
-              CONCAT(rc.iso2, '-', rs.code) as code,
-              rs.name,
-              rc.name as country_name,
-              MAX(ucv.last_visited_at) as visited_at
-            FROM user_cell_visits ucv
-            JOIN h3_cells hc ON ucv.h3_index = hc.h3_index
-            JOIN regions_state rs ON hc.state_id = rs.id
-            JOIN regions_country rc ON rs.country_id = rc.id
-            WHERE ucv.user_id = :user_id AND ucv.res = 8
-            GROUP BY rs.id, rs.code, rs.name, rc.iso2, rc.name
-            ORDER BY visited_at DESC
-            LIMIT 3
+        # Fetch recent countries and regions in a single round trip. Each
+        # branch uses DISTINCT ON to keep only a region's newest visit; the
+        # user's res-8 visits are still read (via ix_user_cell_visits_user_res)
+        # and sorted by region, since that order comes from h3_cells.
+        recent_query = text("""
+            SELECT kind, code, name, country_name, visited_at
+            FROM (
+              (
+                SELECT
+                  'country' as kind,
+                  rc.iso2 as code,
+                  rc.name,
+                  NULL as country_name,
+                  t.last_visited_at as visited_at
+                FROM (
+                  SELECT DISTINCT ON (hc.country_id)
+                    hc.country_id,
+                    ucv.last_visited_at
+                  FROM user_cell_visits ucv
+                  JOIN h3_cells hc ON ucv.h3_index = hc.h3_index
+                  WHERE ucv.user_id = :user_id AND ucv.res = 8 AND hc.country_id IS NOT NULL
+                  ORDER BY hc.country_id, ucv.last_visited_at DESC
+                ) t
+                JOIN regions_country rc ON rc.id = t.country_id
+                ORDER BY t.last_visited_at DESC
+                LIMIT 3
+              )
+              UNION ALL
+              (
+                SELECT
+                  'region' as kind,
+                  CONCAT(rc.iso2, '-', rs.code) as code,
+                  rs.name,
+                  rc.name as country_name,
+                  t.last_visited_at as visited_at
+                FROM (
+                  SELECT DISTINCT ON (hc.state_id)
+                    hc.state_id,
+                    ucv.last_visited_at
+                  FROM user_cell_visits ucv
+                  JOIN h3_cells hc ON ucv.h3_index = hc.h3_index
+                  WHERE ucv.user_id = :user_id AND ucv.res = 8 AND hc.state_id IS NOT NULL
+                  ORDER BY hc.state_id, ucv.last_visited_at DESC
+                ) t
+                JOIN regions_state rs ON rs.id = t.state_id
+                JOIN regions_country rc ON rs.country_id = rc.id
+                ORDER BY t.last_visited_at DESC
+                LIMIT 3
+              )
+            ) recent
+            ORDER BY kind, visited_at DESC
         """)
 
-        regions_rows = self.db.execute(regions_query, {"user_id": self.user_id}).fetchall()
+        recent_rows = self.db.execute(recent_query, {"user_id": self.user_id}).fetchall()
+        countries_rows = [row for row in recent_rows if row.kind == "country"]
+        regions_rows = [row for row in recent_rows if row.kind == "region"]
 
         # Build response structure
         return {
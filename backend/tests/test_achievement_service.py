@@ -14,6 +14,9 @@ from services.achievement_service import AchievementService
 from tests.fixtures.test_data import SAN_FRANCISCO, SYDNEY
 
 
+pytestmark = pytest.mark.postgis
+
+
 @pytest.fixture
 def seed_achievements(db_session: Session) -> list[Achievement]:
     """Seed test achievements into the database."""
@@ -1,5 +1,7 @@
 """Tests for achievements router endpoints."""
 
+from types import SimpleNamespace
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import text
@@ -11,27 +13,80 @@ from tests.conftest import create_jwt_token
 from tests.fixtures.test_data import SAN_FRANCISCO
 
 
+pytestmark = pytest.mark.postgis
+
+
+ROUTER_ACHIEVEMENTS = [
+    {"code": "first_steps", "name": "First Steps", "description": "Visit your first location",
+     "criteria_json": {"type": "cells_total", "threshold": 1}},
+    {"code": "explorer", "name": "Explorer", "description": "Visit 100 unique cells",
+     "criteria_json": {"type": "cells_total", "threshold": 100}},
+]
+
+
+@pytest.fixture(scope="module")
+def seeded_state(test_engine) -> SimpleNamespace:
+    """Seed the router achievements once for the whole module.
+
+    The rows are inserted inside an outer transaction on a module-owned
+    connection and rolled back at module teardown, so nothing is committed.
+    Each test runs in its own SAVEPOINT on that connection (see db_session).
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
+
+    achievements = [Achievement(**data) for data in ROUTER_ACHIEVEMENTS]
+    session.add_all(achievements)
+    session.flush()
+
+    state = SimpleNamespace(
+        connection=connection,
+        achievement_ids=[a.id for a in achievements],
+    )
+    # Release the seeding SAVEPOINT into the outer transaction; closing the
+    # session without committing would roll the rows back.
+    session.commit()
+    session.close()
+
+    yield state
+
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def db_session(seeded_state: SimpleNamespace):
+    """Session on the seeded connection, rolled back to a SAVEPOINT after each test.
+
+    Overrides the conftest fixture for this module, so client, test_user and
+    the router's get_db all share the module connection.
+    """
+    savepoint = seeded_state.connection.begin_nested()
+    session = Session(bind=seeded_state.connection, join_transaction_mode="create_savepoint")
+
+    yield session
+
+    session.close()
+    if savepoint.is_active:
+        savepoint.rollback()
+
+
 @pytest.fixture
-def seed_achievements_for_router(db_session: Session) -> list[Achievement]:
-    """Seed achievements for router tests."""
-    achievements_data = [
-        {"code": "first_steps", "name": "First Steps", "description": "Visit your first location",
-         "criteria_json": {"type": "cells_total", "threshold": 1}},
-        {"code": "explorer", "name": "Explorer", "description": "Visit 100 unique cells",
-         "criteria_json": {"type": "cells_total", "threshold": 100}},
-    ]
-
-    achievements = []
-    for data in achievements_data:
-        achievement = Achievement(**data)
-        db_session.add(achievement)
-        achievements.append(achievement)
-
-    db_session.commit()
-    for a in achievements:
-        db_session.refresh(a)
-
-    return achievements
+def seed_achievements_for_router(
+    db_session: Session, seeded_state: SimpleNamespace
+) -> list[Achievement]:
+    """Return the module-seeded achievements bound to the test session."""
+    return (
+        db_session.query(Achievement)
+        .filter(Achievement.id.in_(seeded_state.achievement_ids))
+        .order_by(Achievement.id)
+        .all()
+    )
 
 
 class TestGetAllAchievements:
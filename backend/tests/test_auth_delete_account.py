@@ -1,296 +1,231 @@
 """Integration tests for DELETE /api/auth/account endpoint."""
 
-import json
+from types import SimpleNamespace
 
 import pytest
 from fastapi import status
+from sqlalchemy.orm import Session
 from models.user import User
 from models.device import Device
 from models.visits import UserCellVisit, IngestBatch
 from models.achievements import UserAchievement, Achievement
 from models.geo import H3Cell
+from tests.conftest import TEST_PASSWORD_HASH, create_jwt_token, override_get_db
 
 
-def test_delete_account_success(client, test_user, auth_headers, db_session):
-    """Test successful account deletion with valid password and confirmation."""
-    response = client.request(
-        "DELETE",
-        "/api/auth/account",
-        content=json.dumps({"password": "TestPass123", "confirmation": "DELETE"}),
-        headers={**auth_headers, "Content-Type": "application/json"},
-    )
-    assert response.status_code == status.HTTP_204_NO_CONTENT
-    assert response.content == b""  # No response body for 204
-
-    # Verify token is now invalid (user deleted)
-    response = client.get("/api/auth/me", headers=auth_headers)
-    assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-
-def test_delete_account_wrong_password(client, test_user, auth_headers, db_session):
-    """Test deletion fails with incorrect password."""
-    response = client.request(
-        "DELETE",
-        "/api/auth/account",
-        content=json.dumps({"password": "WrongPassword123", "confirmation": "DELETE"}),
-        headers={**auth_headers, "Content-Type": "application/json"},
-    )
-    assert response.status_code == status.HTTP_401_UNAUTHORIZED
-    assert "Invalid password" in response.json()["detail"]
+# Share the session event loop (and the session-scoped async client on it).
+# Keep the module on one xdist worker so seeded_state is built only once.
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.xdist_group("cascade"),
+]
 
-    # Verify user still exists
-    response = client.get("/api/auth/me", headers=auth_headers)
-    assert response.status_code == status.HTTP_200_OK
+SEEDED_H3_INDEX = "882830810ffffff"
 
+# Request bodies (httpx serializes without mutating, so sharing is safe)
+VALID_DELETE = {"password": "TestPass123", "confirmation": "DELETE"}
+WRONG_PASSWORD_DELETE = {"password": "WrongPassword123", "confirmation": "DELETE"}
+LOWERCASE_CONFIRMATION_DELETE = {"password": "TestPass123", "confirmation": "delete"}
+MISSING_CONFIRMATION_DELETE = {"password": "TestPass123"}
+MISSING_PASSWORD_DELETE = {"confirmation": "DELETE"}
 
-def test_delete_account_unauthenticated(client):
-    """Test deletion requires authentication."""
-    response = client.request(
-        "DELETE",
-        "/api/auth/account",
-        content=json.dumps({"password": "TestPass123", "confirmation": "DELETE"}),
-        headers={"Content-Type": "application/json"},
-    )
-    assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
+@pytest.fixture(scope="module")
+def seeded_state(test_engine) -> SimpleNamespace:
+    """Seed one user plus a row in every table that cascades from it.
 
-def test_delete_account_wrong_confirmation(client, test_user, auth_headers):
-    """Test deletion fails with incorrect confirmation text."""
-    response = client.request(
-        "DELETE",
-        "/api/auth/account",
-        content=json.dumps({"password": "TestPass123", "confirmation": "delete"}),  # lowercase
-        headers={**auth_headers, "Content-Type": "application/json"},
+    Everything is inserted once per module inside an outer transaction that
+    is rolled back at module teardown. Each test runs in its own SAVEPOINT
+    on the same connection (see seeded_db_session), so even tests that
+    delete the account see a fresh copy of the seeded state.
+    Password: TestPass123
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
     )
-    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
-    # Verify error message mentions confirmation validation
-    errors = response.json()["detail"]
-    assert any(
-        "Confirmation must be exactly 'DELETE'" in str(error)
-        for error in errors
+    user = User(
+        username="delete_account_module_user",
+        email="delete-account-module@example.com",
+        hashed_password=TEST_PASSWORD_HASH,
     )
-
-    # Verify user still exists
-    response = client.get("/api/auth/me", headers=auth_headers)
-    assert response.status_code == status.HTTP_200_OK
-
-
-def test_delete_account_missing_confirmation(client, test_user, auth_headers):
-    """Test deletion fails with missing confirmation field."""
-    response = client.request(
-        "DELETE",
-        "/api/auth/account",
-        content=json.dumps({"password": "TestPass123"}),
-        headers={**auth_headers, "Content-Type": "application/json"},
+    h3_cell = H3Cell(
+        h3_index=SEEDED_H3_INDEX,
+        res=8,
+        centroid="POINT(-122.4194 37.7749)"
     )
-    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-    # Verify user still exists
-    response = client.get("/api/auth/me", headers=auth_headers)
-    assert response.status_code == status.HTTP_200_OK
-
-
-def test_delete_account_missing_password(client, test_user, auth_headers):
-    """Test deletion fails with missing password field."""
-    response = client.request(
-        "DELETE",
-        "/api/auth/account",
-        content=json.dumps({"confirmation": "DELETE"}),
-        headers={**auth_headers, "Content-Type": "application/json"},
+    achievement = Achievement(
+        code="first_steps",
+        name="First Steps",
+        description="Visit your first location"
     )
-    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-    # Verify user still exists
-    response = client.get("/api/auth/me", headers=auth_headers)
-    assert response.status_code == status.HTTP_200_OK
+    session.add_all([
+        user,
+        h3_cell,
+        achievement,
+        Device(user=user, device_name="Test Device", platform="ios"),
+        UserCellVisit(user=user, cell=h3_cell, res=8),
+        IngestBatch(user=user, cells_count=50, res_min=6, res_max=8),
+        UserAchievement(user=user, achievement=achievement),
+    ])
+    session.flush()
 
-
-def test_delete_account_cascades_to_device(client, test_user, auth_headers, db_session):
-    """Test that deleting user cascades to Device table."""
-    # Create device for user
-    device = Device(
-        user_id=test_user.id,
-        device_name="Test Device",
-        platform="ios"
+    state = SimpleNamespace(
+        connection=connection,
+        user=user,
+        achievement_id=achievement.id,
     )
-    db_session.add(device)
-    db_session.commit()
-    device_id = device.id
+    # Release the seeding SAVEPOINT into the outer transaction; closing the
+    # session without committing would roll the rows back.
+    session.commit()
+    session.expunge_all()
+    session.close()
 
-    # Verify device exists
-    assert db_session.query(Device).filter(Device.id == device_id).count() == 1
+    yield state
 
-    # Expire session to let database CASCADE handle deletion
-    db_session.expire_all()
+    transaction.rollback()
+    connection.close()
 
-    # Delete account
-    response = client.request(
-        "DELETE",
-        "/api/auth/account",
-        content=json.dumps({"password": "TestPass123", "confirmation": "DELETE"}),
-        headers={**auth_headers, "Content-Type": "application/json"},
-    )
-    assert response.status_code == status.HTTP_204_NO_CONTENT
 
-    # Verify device was CASCADE deleted
-    assert db_session.query(Device).filter(Device.id == device_id).count() == 0
-    assert db_session.query(Device).filter(Device.user_id == test_user.id).count() == 0
+@pytest.fixture
+def seeded_db_session(seeded_state: SimpleNamespace):
+    """Session on the seeded connection, rolled back to a SAVEPOINT after each test."""
+    savepoint = seeded_state.connection.begin_nested()
+    session = Session(bind=seeded_state.connection, join_transaction_mode="create_savepoint")
 
+    yield session
 
-def test_delete_account_cascades_to_user_cell_visits(client, test_user, auth_headers, db_session):
-    """Test that deleting user cascades to UserCellVisit table."""
-    # Create H3 cell and user visit
-    h3_cell = H3Cell(
-        h3_index="882830810ffffff",
-        res=8,
-        centroid="POINT(-122.4194 37.7749)"
-    )
-    db_session.add(h3_cell)
-    db_session.flush()
-
-    visit = UserCellVisit(
-        user_id=test_user.id,
-        h3_index="882830810ffffff",
-        res=8
-    )
-    db_session.add(visit)
-    db_session.commit()
-    visit_id = visit.id
+    session.close()
+    if savepoint.is_active:
+        savepoint.rollback()
 
-    # Verify visit exists
-    assert db_session.query(UserCellVisit).filter(UserCellVisit.id == visit_id).count() == 1
 
-    # Expire session to let database CASCADE handle deletion
-    db_session.expire_all()
+@pytest.fixture
+def seeded_client(_session_async_client, seeded_db_session: Session):
+    """Async client whose requests use seeded_db_session."""
+    with override_get_db(seeded_db_session):
+        yield _session_async_client
 
-    # Delete account
-    response = client.request(
-        "DELETE",
-        "/api/auth/account",
-        content=json.dumps({"password": "TestPass123", "confirmation": "DELETE"}),
-        headers={**auth_headers, "Content-Type": "application/json"},
-    )
-    assert response.status_code == status.HTTP_204_NO_CONTENT
 
-    # Verify visit was CASCADE deleted
-    assert db_session.query(UserCellVisit).filter(UserCellVisit.id == visit_id).count() == 0
-    assert db_session.query(UserCellVisit).filter(UserCellVisit.user_id == test_user.id).count() == 0
+@pytest.fixture(scope="module")
+def test_user_module(seeded_state: SimpleNamespace) -> User:
+    """The seeded user shared by every test in this module."""
+    return seeded_state.user
 
 
-def test_delete_account_cascades_to_ingest_batches(client, test_user, auth_headers, db_session):
-    """Test that deleting user cascades to IngestBatch table."""
-    # Create ingest batch
-    batch = IngestBatch(
-        user_id=test_user.id,
-        cells_count=50,
-        res_min=6,
-        res_max=8
+@pytest.fixture(scope="module")
+def test_user_module_headers(test_user_module: User) -> dict:
+    """Authorization headers for test_user_module, signed once per module."""
+    token = create_jwt_token(
+        test_user_module.id,
+        test_user_module.username,
+        token_ver=test_user_module.token_version,
     )
-    db_session.add(batch)
-    db_session.commit()
-    batch_id = batch.id
+    return {"Authorization": f"Bearer {token}"}
 
-    # Verify batch exists
-    assert db_session.query(IngestBatch).filter(IngestBatch.id == batch_id).count() == 1
 
-    # Expire session to let database CASCADE handle deletion
-    db_session.expire_all()
-
-    # Delete account
-    response = client.request(
+async def test_delete_account_success(seeded_client, test_user_module_headers):
+    """Test successful account deletion with valid password and confirmation."""
+    response = await seeded_client.request(
         "DELETE",
         "/api/auth/account",
-        content=json.dumps({"password": "TestPass123", "confirmation": "DELETE"}),
-        headers={**auth_headers, "Content-Type": "application/json"},
+        json=VALID_DELETE,
+        headers=test_user_module_headers,
     )
     assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert response.content == b""  # No response body for 204
 
-    # Verify batch was CASCADE deleted
-    assert db_session.query(IngestBatch).filter(IngestBatch.id == batch_id).count() == 0
-    assert db_session.query(IngestBatch).filter(IngestBatch.user_id == test_user.id).count() == 0
-
-
-def test_delete_account_cascades_to_user_achievements(client, test_user, auth_headers, db_session):
-    """Test that deleting user cascades to UserAchievement table."""
-    # Create achievement and user unlock
-    achievement = Achievement(
-        code="first_steps",
-        name="First Steps",
-        description="Visit your first location"
-    )
-    db_session.add(achievement)
-    db_session.flush()
-
-    user_achievement = UserAchievement(
-        user_id=test_user.id,
-        achievement_id=achievement.id
-    )
-    db_session.add(user_achievement)
-    db_session.commit()
-    user_achievement_id = user_achievement.id
-
-    # Verify user achievement exists
-    assert db_session.query(UserAchievement).filter(UserAchievement.id == user_achievement_id).count() == 1
+    # Verify token is now invalid (user deleted)
+    response = await seeded_client.get("/api/auth/me", headers=test_user_module_headers)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    # Expire session to let database CASCADE handle deletion
-    db_session.expire_all()
 
-    # Delete account
-    response = client.request(
+REJECTION_CASES = [
+    pytest.param(
+        WRONG_PASSWORD_DELETE, True,
+        status.HTTP_401_UNAUTHORIZED, "Invalid password",
+        id="wrong_password",
+    ),
+    pytest.param(
+        VALID_DELETE, False,
+        status.HTTP_401_UNAUTHORIZED, None,
+        id="unauthenticated",
+    ),
+    pytest.param(
+        LOWERCASE_CONFIRMATION_DELETE, True,
+        status.HTTP_422_UNPROCESSABLE_ENTITY, "Confirmation must be exactly 'DELETE'",
+        id="wrong_confirmation",
+    ),
+    pytest.param(
+        MISSING_CONFIRMATION_DELETE, True,
+        status.HTTP_422_UNPROCESSABLE_ENTITY, None,
+        id="missing_confirmation",
+    ),
+    pytest.param(
+        MISSING_PASSWORD_DELETE, True,
+        status.HTTP_422_UNPROCESSABLE_ENTITY, None,
+        id="missing_password",
+    ),
+]
+
+
+@pytest.mark.parametrize("payload,authenticated,status_code,fragment", REJECTION_CASES)
+async def test_delete_account_rejects_invalid(
+    seeded_client, seeded_db_session, test_user_module, test_user_module_headers,
+    payload, authenticated, status_code, fragment,
+):
+    """Test deletion is rejected for bad credentials, auth, or request bodies."""
+    headers = test_user_module_headers if authenticated else {}
+    response = await seeded_client.request(
         "DELETE",
         "/api/auth/account",
-        content=json.dumps({"password": "TestPass123", "confirmation": "DELETE"}),
-        headers={**auth_headers, "Content-Type": "application/json"},
+        json=payload,
+        headers=headers,
     )
-    assert response.status_code == status.HTTP_204_NO_CONTENT
-
-    # Verify user achievement was CASCADE deleted
-    assert db_session.query(UserAchievement).filter(UserAchievement.id == user_achievement_id).count() == 0
-    assert db_session.query(UserAchievement).filter(UserAchievement.user_id == test_user.id).count() == 0
+    assert response.status_code == status_code
 
-    # Verify achievement definition still exists (global catalog)
-    assert db_session.query(Achievement).filter(Achievement.id == achievement.id).count() == 1
+    # Verify error message when the case has a specific one
+    if fragment is not None:
+        assert fragment in str(response.json()["detail"])
 
+    # Verify user still exists
+    assert seeded_db_session.query(User).filter(User.id == test_user_module.id).first() is not None
 
-def test_delete_account_preserves_h3_cells(client, test_user, auth_headers, db_session):
-    """Test that deleting user does NOT delete global H3 cells."""
-    # Create H3 cell
-    h3_cell = H3Cell(
-        h3_index="882830810ffffff",
-        res=8,
-        centroid="POINT(-122.4194 37.7749)"
-    )
-    db_session.add(h3_cell)
-    db_session.flush()
-
-    # Create user visit to that cell
-    visit = UserCellVisit(
-        user_id=test_user.id,
-        h3_index="882830810ffffff",
-        res=8
-    )
-    db_session.add(visit)
-    db_session.commit()
 
-    # Verify both cell and visit exist
-    assert db_session.query(H3Cell).filter(H3Cell.h3_index == "882830810ffffff").count() == 1
-    assert db_session.query(UserCellVisit).filter(UserCellVisit.user_id == test_user.id).count() == 1
+async def test_delete_account_cascades_all_children(
+    seeded_client, seeded_state, seeded_db_session, test_user_module_headers
+):
+    """Test that deleting user cascades to owned rows but keeps global catalogs."""
+    user_id = seeded_state.user.id
 
-    # Expire session to let database CASCADE handle deletion
-    db_session.expire_all()
+    # Verify all seeded rows exist
+    assert seeded_db_session.query(Device).filter(Device.user_id == user_id).count() == 1
+    assert seeded_db_session.query(UserCellVisit).filter(UserCellVisit.user_id == user_id).count() == 1
+    assert seeded_db_session.query(IngestBatch).filter(IngestBatch.user_id == user_id).count() == 1
+    assert seeded_db_session.query(UserAchievement).filter(UserAchievement.user_id == user_id).count() == 1
 
     # Delete account
-    response = client.request(
+    response = await seeded_client.request(
         "DELETE",
         "/api/auth/account",
-        content=json.dumps({"password": "TestPass123", "confirmation": "DELETE"}),
-        headers={**auth_headers, "Content-Type": "application/json"},
+        json=VALID_DELETE,
+        headers=test_user_module_headers,
     )
     assert response.status_code == status.HTTP_204_NO_CONTENT
 
-    # Verify H3 cell still exists (global registry)
-    assert db_session.query(H3Cell).filter(H3Cell.h3_index == "882830810ffffff").count() == 1
+    # Expire session so the queries below see the database CASCADE results
+    seeded_db_session.expire_all()
+
+    # Verify user-owned rows were CASCADE deleted
+    assert seeded_db_session.query(Device).filter(Device.user_id == user_id).count() == 0
+    assert seeded_db_session.query(UserCellVisit).filter(UserCellVisit.user_id == user_id).count() == 0
+    assert seeded_db_session.query(IngestBatch).filter(IngestBatch.user_id == user_id).count() == 0
+    assert seeded_db_session.query(UserAchievement).filter(UserAchievement.user_id == user_id).count() == 0
 
-    # But user visit is gone
-    assert db_session.query(UserCellVisit).filter(UserCellVisit.user_id == test_user.id).count() == 0
+    # Verify global H3 cell registry and achievement catalog are preserved
+    assert seeded_db_session.query(H3Cell).filter(H3Cell.h3_index == SEEDED_H3_INDEX).count() == 1
+    assert seeded_db_session.query(Achievement).filter(Achievement.id == seeded_state.achievement_id).count() == 1
@@ -6,6 +6,9 @@ from fastapi import status
 import h3
 
 
+pytestmark = pytest.mark.postgis
+
+
 class TestBatchLocationIngest:
     """Tests for POST /api/v1/location/ingest/batch"""
 
@@ -25,6 +25,9 @@ from tests.fixtures.test_data import (
 )
 
 
+pytestmark = pytest.mark.postgis
+
+
 # ============================================================================
 # Fixtures
 # ============================================================================
@@ -26,6 +26,9 @@ from tests.fixtures.test_data import (
 from sqlalchemy.orm import Session
 
 
+pytestmark = pytest.mark.postgis
+
+
 # ============================================================================
 # Request Validation Tests
 # ============================================================================
@@ -10,6 +10,9 @@ from tests.conftest import create_jwt_token
 from tests.fixtures.test_data import SAN_FRANCISCO
 
 
+pytestmark = pytest.mark.postgis
+
+
 @pytest.mark.integration
 class TestMapSummaryEndpoint:
     """Test GET /api/v1/map/summary endpoint."""
@@ -9,6 +9,9 @@ from services.map_service import MapService
 from tests.fixtures.test_data import SAN_FRANCISCO, TOKYO, LOS_ANGELES
 
 
+pytestmark = pytest.mark.postgis
+
+
 @pytest.mark.integration
 class TestMapServiceSummary:
     """Test MapService.get_summary() method."""
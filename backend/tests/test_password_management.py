@@ -1,14 +1,19 @@
 """Tests for password management functionality."""
 
-import hashlib
-import os
+import hmac
+import json
+from functools import lru_cache
 from unittest.mock import MagicMock, patch
 
-from datetime import datetime, timedelta
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Optional
 
 import pytest
 from fastapi.testclient import TestClient
+from jose import jwt
 from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from models.password_reset import PasswordResetToken
@@ -16,7 +21,102 @@ from models.user import User
 from schemas.auth import ChangePasswordRequest, ResetPasswordRequest
 from services.auth import create_tokens
 from services.auth import hash_password, verify_password
-from services.password_service import PasswordService
+from services.email_service import EmailService
+from services.password_service import PasswordService, hash_reset_token
+from tests.conftest import create_jwt_token
+
+
+# Fixed timestamps for seeded reset tokens: valid and expired regardless of
+# when the suite runs
+FAR_FUTURE = datetime(2099, 1, 1)
+FAR_PAST = datetime(2000, 1, 1)
+
+# Placeholder token hashes for the model tests (SHA-256 hex is 64 chars)
+TOKEN_A = "a" * 64
+TOKEN_B = "b" * 64
+TOKEN_C = "c" * 64
+
+# Stored digests of the raw reset tokens seeded below, computed at import
+TOKEN_HASHES = {
+    raw: hash_reset_token(raw)
+    for raw in (
+        "test_reset_token_12345",
+        "expired_token_12345",
+        "used_token_12345",
+        "endpoint_reset_token_12345",
+        "expired_endpoint_token",
+        "used_endpoint_token",
+        "weak_reset_token",
+        "prior_reset_token_12345",
+    )
+}
+
+
+# Stored hash for seeded users whose password is never checked; the real
+# hashing and verify paths under test are left untouched
+UNVERIFIED_HASH = "$2b$12$hashedpassword"
+
+
+@lru_cache(maxsize=None)
+def _hashed(password: str) -> str:
+    """Hash each distinct fixture password once per session.
+
+    Only used to seed users; verify_password assertions still run bcrypt.
+    """
+    return hash_password(password)
+
+
+def _make_reset_token(
+    session: Session,
+    user: User,
+    raw_token: str,
+    *,
+    expires_at: datetime = FAR_FUTURE,
+    used_at: Optional[datetime] = None,
+) -> None:
+    """Insert a reset token row for an already-flushed user (no service call).
+
+    Defaults to an unused, unexpired token. The row is bulk-inserted, skipping
+    the unit of work, since callers only need it to exist in the database.
+    """
+    session.bulk_save_objects([
+        PasswordResetToken(
+            user_id=user.id,
+            token_hash=TOKEN_HASHES[raw_token],
+            expires_at=expires_at,
+            used_at=used_at,
+        )
+    ])
+
+
+@pytest.fixture
+def password_service(db_session: Session) -> PasswordService:
+    """PasswordService bound to the test session.
+
+    Tests that patch services.password_service.EmailService construct their
+    own service instead, since the patch must be active at construction.
+    """
+    return PasswordService(db_session)
+
+
+@pytest.fixture
+def email_service() -> EmailService:
+    """EmailService built from the test configuration."""
+    return EmailService()
+
+
+@pytest.fixture
+def reset_user(db_session: Session) -> User:
+    """User that the reset-password tests attach their reset tokens to."""
+    user = User(
+        username="reset_user",
+        email="reset@example.com",
+        hashed_password=UNVERIFIED_HASH,
+        token_version=1,
+    )
+    db_session.add(user)
+    db_session.flush()
+    return user
 
 
 @pytest.mark.integration
@@ -28,11 +128,10 @@ class TestUserTokenVersion:
         user = User(
             username="version_test_user",
             email="version@example.com",
-            hashed_password="$2b$12$hashedpassword",
+            hashed_password=UNVERIFIED_HASH,
         )
         db_session.add(user)
-        db_session.commit()
-        db_session.refresh(user)
+        db_session.flush()  # applies the column default, no reload needed
 
         assert hasattr(user, "token_version")
         assert user.token_version == 1
@@ -42,13 +141,13 @@ class TestUserTokenVersion:
         user = User(
             username="increment_test_user",
             email="increment@example.com",
-            hashed_password="$2b$12$hashedpassword",
+            hashed_password=UNVERIFIED_HASH,
         )
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()
 
         user.token_version += 1
-        db_session.commit()
+        db_session.flush()
         db_session.refresh(user)
 
         assert user.token_version == 2
@@ -62,16 +161,15 @@ class TestPasswordResetTokenModel:
         """Verify PasswordResetToken can be created and saved."""
         token = PasswordResetToken(
             user_id=test_user.id,
-            token_hash="a" * 64,  # SHA-256 hash is 64 hex chars
-            expires_at=datetime.utcnow() + timedelta(hours=1),
+            token_hash=TOKEN_A,
+            expires_at=FAR_FUTURE,
         )
         db_session.add(token)
-        db_session.commit()
-        db_session.refresh(token)
+        db_session.flush()
 
         assert token.id is not None
         assert token.user_id == test_user.id
-        assert token.token_hash == "a" * 64
+        assert token.token_hash == TOKEN_A
         assert token.used_at is None
         assert token.created_at is not None
 
@@ -79,18 +177,28 @@ class TestPasswordResetTokenModel:
         """Verify used_at can be set when token is consumed."""
         token = PasswordResetToken(
             user_id=test_user.id,
-            token_hash="b" * 64,
-            expires_at=datetime.utcnow() + timedelta(hours=1),
+            token_hash=TOKEN_B,
+            expires_at=FAR_FUTURE,
         )
         db_session.add(token)
-        db_session.commit()
+        db_session.flush()
 
         # Mark as used
-        token.used_at = datetime.utcnow()
-        db_session.commit()
+        token.used_at = FAR_PAST
+        db_session.flush()
         db_session.refresh(token)
 
-        assert token.used_at is not None
+        assert token.used_at == FAR_PAST
+
+    def test_token_hash_is_unique(self, db_session: Session, test_user: User):
+        """Verify two tokens cannot share a hash (also holds under FAST_TESTS SQLite)."""
+        db_session.add_all([
+            PasswordResetToken(user_id=test_user.id, token_hash=TOKEN_A, expires_at=FAR_FUTURE),
+            PasswordResetToken(user_id=test_user.id, token_hash=TOKEN_A, expires_at=FAR_FUTURE),
+        ])
+
+        with pytest.raises(IntegrityError):
+            db_session.flush()
 
     def test_token_cascade_deletes_with_user(self, db_session: Session):
         """Verify tokens are deleted when user is deleted."""
@@ -98,24 +206,25 @@ class TestPasswordResetTokenModel:
         user = User(
             username="cascade_test_user",
             email="cascade@example.com",
-            hashed_password="$2b$12$hashedpassword",
+            hashed_password=UNVERIFIED_HASH,
         )
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()
 
-        # Create token for user
+        # Create token for user (by id, so the user's token collection stays
+        # unloaded and the delete relies on the database ON DELETE CASCADE)
         token = PasswordResetToken(
             user_id=user.id,
-            token_hash="c" * 64,
-            expires_at=datetime.utcnow() + timedelta(hours=1),
+            token_hash=TOKEN_C,
+            expires_at=FAR_FUTURE,
         )
         db_session.add(token)
-        db_session.commit()
+        db_session.flush()
         token_id = token.id
 
         # Delete user
         db_session.delete(user)
-        db_session.commit()
+        db_session.flush()
 
         # Verify token is gone
         deleted_token = (
@@ -126,6 +235,25 @@ class TestPasswordResetTokenModel:
         assert deleted_token is None
 
 
+class TestPasswordHashingCost:
+    """Test the bcrypt work factor used in tests and in production."""
+
+    def test_suite_uses_minimum_cost(self):
+        """Verify the suite hashes at cost 4 (BCRYPT_ROUNDS set in conftest)."""
+        assert hash_password("TestPass123").startswith("$2b$04$")
+
+    @pytest.mark.slow
+    def test_production_cost_hash_round_trip(self, monkeypatch):
+        """Verify a cost-12 hash is produced and verifies correctly."""
+        monkeypatch.setattr("services.auth.BCRYPT_ROUNDS", 12)
+
+        hashed = hash_password("TestPass123")
+
+        assert hashed.startswith("$2b$12$")
+        assert verify_password("TestPass123", hashed)
+        assert not verify_password("WrongPass123", hashed)
+
+
 class TestPasswordSchemas:
     """Test password management Pydantic schemas."""
 
@@ -199,11 +327,9 @@ class TestTokenVersionValidation:
 
     def test_token_includes_version(self, db_session: Session, test_user: User):
         """Verify created tokens include token_ver claim."""
-        from jose import jwt
-
         # Ensure user has token_version
         test_user.token_version = 1
-        db_session.commit()
+        db_session.flush()
 
         tokens = create_tokens(test_user)
 
@@ -224,25 +350,16 @@ class TestTokenVersionValidation:
         test_user: User,
     ):
         """Verify token with old version is rejected after increment."""
-        from jose import jwt
-
         # User starts with token_version = 1 (set by fixture or default)
         test_user.token_version = 1
-        db_session.commit()
+        db_session.flush()
 
         # Create token with version 1
-        payload = {
-            "sub": str(test_user.id),
-            "username": test_user.username,
-            "exp": datetime.utcnow() + timedelta(hours=1),
-            "type": "access",
-            "token_ver": 1,
-        }
-        old_token = jwt.encode(payload, "test-secret-key", algorithm="HS256")
+        old_token = create_jwt_token(test_user.id, test_user.username, token_ver=1)
 
         # Increment user's token version (simulating password change)
         test_user.token_version = 2
-        db_session.commit()
+        db_session.flush()
 
         # Try to use old token
         response = client.get(
@@ -252,8 +369,8 @@ class TestTokenVersionValidation:
 
         assert response.status_code == 401
         assert (
-            "invalidated" in response.json()["detail"].lower()
-            or "log in again" in response.json()["detail"].lower()
+            b"invalidated" in response.content.lower()
+            or b"log in again" in response.content.lower()
         )
 
 
@@ -261,80 +378,65 @@ class TestTokenVersionValidation:
 class TestPasswordServiceChangePassword:
     """Test PasswordService.change_password method."""
 
-    def test_change_password_success(self, db_session: Session):
-        """Verify password can be changed with correct current password."""
+    @pytest.mark.parametrize(
+        "current_password,expected_result,expected_version",
+        [
+            pytest.param("OriginalPass123", True, 2, id="success"),
+            pytest.param("WrongPass123", False, 1, id="wrong_current_password"),
+        ],
+    )
+    def test_change_password(
+        self,
+        db_session: Session,
+        password_service: PasswordService,
+        current_password: str,
+        expected_result: bool,
+        expected_version: int,
+    ):
+        """Verify password changes only with the correct current password."""
         # Create user with known password
-        original_password = "OriginalPass123"
         user = User(
             username="change_pass_user",
             email="changepass@example.com",
-            hashed_password=hash_password(original_password),
+            hashed_password=_hashed("OriginalPass123"),
             token_version=1,
         )
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()
+        original_hash = user.hashed_password
 
         # Change password
-        service = PasswordService(db_session)
-        result = service.change_password(
+        result = password_service.change_password(
             user=user,
-            current_password=original_password,
+            current_password=current_password,
             new_password="NewPassword456",
         )
 
-        assert result is True
+        assert result is expected_result
 
-        # Verify new password works
+        # Verify the hash was rotated only on success (string compare, no bcrypt)
         db_session.refresh(user)
-        assert verify_password("NewPassword456", user.hashed_password)
+        assert hmac.compare_digest(original_hash, user.hashed_password) is not expected_result
+        if expected_result:
+            assert verify_password("NewPassword456", user.hashed_password)
 
-        # Verify token version was incremented
-        assert user.token_version == 2
-
-    def test_change_password_wrong_current_password(self, db_session: Session):
-        """Verify change fails with incorrect current password."""
-        user = User(
-            username="wrong_pass_user",
-            email="wrongpass@example.com",
-            hashed_password=hash_password("CorrectPass123"),
-            token_version=1,
-        )
-        db_session.add(user)
-        db_session.commit()
-
-        service = PasswordService(db_session)
-        result = service.change_password(
-            user=user,
-            current_password="WrongPass123",
-            new_password="NewPassword456",
-        )
-
-        assert result is False
-
-        # Verify password unchanged
-        db_session.refresh(user)
-        assert verify_password("CorrectPass123", user.hashed_password)
-
-        # Verify token version unchanged
-        assert user.token_version == 1
+        # Verify token version was incremented only on success
+        assert user.token_version == expected_version
 
 
 class TestEmailService:
     """Test EmailService for password reset emails."""
 
     @patch("services.email_service.SendGridAPIClient")
-    def test_send_password_reset_success(self, mock_sendgrid_class):
+    def test_send_password_reset_success(self, mock_sendgrid_class, email_service: EmailService):
         """Verify password reset email is sent via SendGrid."""
-        from services.email_service import EmailService
-
         # Configure mock
-        mock_client = MagicMock()
+        mock_client = MagicMock(spec=["send"])
         mock_sendgrid_class.return_value = mock_client
-        mock_client.send.return_value = MagicMock(status_code=202)
+        mock_client.send.return_value = SimpleNamespace(status_code=202)
 
         # Send email
-        service = EmailService()
-        result = service.send_password_reset(
+        result = email_service.send_password_reset(
             to_email="user@example.com",
             username="testuser",
             token="test_token_123",
@@ -344,17 +446,14 @@ class TestEmailService:
         mock_client.send.assert_called_once()
 
     @patch("services.email_service.SendGridAPIClient")
-    def test_send_password_reset_failure_returns_false(self, mock_sendgrid_class):
+    def test_send_password_reset_failure_returns_false(self, mock_sendgrid_class, email_service: EmailService):
         """Verify failed email send returns False."""
-        from services.email_service import EmailService
-
         # Configure mock to raise exception
-        mock_client = MagicMock()
+        mock_client = MagicMock(spec=["send"])
         mock_sendgrid_class.return_value = mock_client
         mock_client.send.side_effect = Exception("SendGrid error")
 
-        service = EmailService()
-        result = service.send_password_reset(
+        result = email_service.send_password_reset(
             to_email="user@example.com",
             username="testuser",
             token="test_token_123",
@@ -362,14 +461,11 @@ class TestEmailService:
 
         assert result is False
 
-    def test_email_contains_reset_url(self):
+    def test_email_contains_reset_url(self, monkeypatch, email_service: EmailService):
         """Verify email HTML contains reset URL with token."""
-        from services.email_service import EmailService
-
-        os.environ["FRONTEND_URL"] = "https://trekkr.app"
+        monkeypatch.setenv("FRONTEND_URL", "https://trekkr.app")
 
-        service = EmailService()
-        html = service._build_reset_email_html(
+        html = email_service._build_reset_email_html(
             username="testuser",
             reset_url="https://trekkr.app/reset-password?token=abc123",
         )
@@ -390,7 +486,7 @@ class TestPasswordServiceForgotPassword:
         db_session: Session,
     ):
         """Verify reset request creates token and sends email."""
-        mock_email_instance = MagicMock()
+        mock_email_instance = MagicMock(spec=["send_password_reset"])
         mock_email_class.return_value = mock_email_instance
         mock_email_instance.send_password_reset.return_value = True
 
@@ -398,11 +494,11 @@ class TestPasswordServiceForgotPassword:
         user = User(
             username="forgot_user",
             email="forgot@example.com",
-            hashed_password=hash_password("SomePass123"),
+            hashed_password=UNVERIFIED_HASH,
             token_version=1,
         )
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()
 
         # Request reset
         service = PasswordService(db_session)
@@ -432,7 +528,7 @@ class TestPasswordServiceForgotPassword:
         db_session: Session,
     ):
         """Verify no error for non-existent email (prevents enumeration)."""
-        mock_email_instance = MagicMock()
+        mock_email_instance = MagicMock(spec=["send_password_reset"])
         mock_email_class.return_value = mock_email_instance
 
         service = PasswordService(db_session)
@@ -450,29 +546,26 @@ class TestPasswordServiceForgotPassword:
         db_session: Session,
     ):
         """Verify new request invalidates previous unused tokens."""
-        mock_email_instance = MagicMock()
+        mock_email_instance = MagicMock(spec=["send_password_reset"])
         mock_email_class.return_value = mock_email_instance
         mock_email_instance.send_password_reset.return_value = True
 
-        # Create user
+        # Create user with a previously issued token
         user = User(
             username="multi_reset_user",
             email="multireset@example.com",
-            hashed_password=hash_password("SomePass123"),
+            hashed_password=UNVERIFIED_HASH,
             token_version=1,
         )
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()
+        _make_reset_token(db_session, user, "prior_reset_token_12345")
 
+        # New request
         service = PasswordService(db_session)
-
-        # First request
         service.request_password_reset("multireset@example.com")
 
-        # Second request
-        service.request_password_reset("multireset@example.com")
-
-        # Should only have one active token
+        # Should only have one active token, and not the prior one
         tokens = (
             db_session.query(PasswordResetToken)
             .filter(
@@ -483,38 +576,33 @@ class TestPasswordServiceForgotPassword:
         )
 
         assert len(tokens) == 1
+        assert tokens[0].token_hash != TOKEN_HASHES["prior_reset_token_12345"]
 
 
 @pytest.mark.integration
 class TestPasswordServiceResetPassword:
     """Test PasswordService.reset_password method."""
 
-    def test_reset_password_success(self, db_session: Session):
+    def test_reset_password_success(
+        self,
+        db_session: Session,
+        password_service: PasswordService,
+        reset_user: User,
+    ):
         """Verify password reset with valid token."""
-        # Create user
-        user = User(
-            username="reset_user",
-            email="reset@example.com",
-            hashed_password=hash_password("OldPass123"),
-            token_version=1,
-        )
-        db_session.add(user)
-        db_session.commit()
-
         # Create valid token
         raw_token = "test_reset_token_12345"
-        token_hash = hashlib.sha256(raw_token.encode()).hexdigest()
+        token_hash = TOKEN_HASHES[raw_token]
         reset_token = PasswordResetToken(
-            user_id=user.id,
+            user=reset_user,
             token_hash=token_hash,
-            expires_at=datetime.utcnow() + timedelta(hours=1),
+            expires_at=FAR_FUTURE,
         )
         db_session.add(reset_token)
-        db_session.commit()
+        db_session.flush()
 
         # Reset password
-        service = PasswordService(db_session)
-        result = service.reset_password(
+        result = password_service.reset_password(
             raw_token=raw_token,
             new_password="NewPassword789",
         )
@@ -522,85 +610,72 @@ class TestPasswordServiceResetPassword:
         assert result is True
 
         # Verify new password works
-        db_session.refresh(user)
-        assert verify_password("NewPassword789", user.hashed_password)
+        db_session.refresh(reset_user)
+        assert verify_password("NewPassword789", reset_user.hashed_password)
 
         # Verify token version incremented
-        assert user.token_version == 2
+        assert reset_user.token_version == 2
 
         # Verify token marked as used
         db_session.refresh(reset_token)
         assert reset_token.used_at is not None
 
-    def test_reset_password_invalid_token(self, db_session: Session):
+    def test_reset_password_invalid_token(self, password_service: PasswordService):
         """Verify reset fails with invalid token."""
-        service = PasswordService(db_session)
-        result = service.reset_password(
+        result = password_service.reset_password(
             raw_token="completely_invalid_token",
             new_password="NewPassword789",
         )
 
         assert result is False
 
-    def test_reset_password_expired_token(self, db_session: Session):
+    def test_reset_password_expired_token(
+        self,
+        db_session: Session,
+        password_service: PasswordService,
+        reset_user: User,
+    ):
         """Verify reset fails with expired token."""
-        # Create user
-        user = User(
-            username="expired_user",
-            email="expired@example.com",
-            hashed_password=hash_password("OldPass123"),
-            token_version=1,
-        )
-        db_session.add(user)
-        db_session.commit()
-
         # Create expired token
         raw_token = "expired_token_12345"
-        token_hash = hashlib.sha256(raw_token.encode()).hexdigest()
+        token_hash = TOKEN_HASHES[raw_token]
         reset_token = PasswordResetToken(
-            user_id=user.id,
+            user=reset_user,
             token_hash=token_hash,
-            expires_at=datetime.utcnow() - timedelta(hours=1),  # Already expired
+            expires_at=FAR_PAST,  # Already expired
         )
         db_session.add(reset_token)
-        db_session.commit()
+        db_session.flush()
 
         # Try to reset
-        service = PasswordService(db_session)
-        result = service.reset_password(
+        result = password_service.reset_password(
             raw_token=raw_token,
             new_password="NewPassword789",
         )
 
         assert result is False
 
-    def test_reset_password_already_used_token(self, db_session: Session):
+    def test_reset_password_already_used_token(
+        self,
+        db_session: Session,
+        password_service: PasswordService,
+        reset_user: User,
+    ):
         """Verify reset fails with already-used token."""
-        # Create user
-        user = User(
-            username="used_token_user",
-            email="usedtoken@example.com",
-            hashed_password=hash_password("OldPass123"),
-            token_version=1,
-        )
-        db_session.add(user)
-        db_session.commit()
-
         # Create already-used token
         raw_token = "used_token_12345"
-        token_hash = hashlib.sha256(raw_token.encode()).hexdigest()
+        token_hash = TOKEN_HASHES[raw_token]
         reset_token = PasswordResetToken(
-            user_id=user.id,
+            user=reset_user,
             token_hash=token_hash,
-            expires_at=datetime.utcnow() + timedelta(hours=1),
-            used_at=datetime.utcnow() - timedelta(minutes=30),  # Already used
+            expires_at=FAR_FUTURE,
+            used_at=FAR_PAST,  # Already used
         )
         db_session.add(reset_token)
-        db_session.commit()
+        db_session.flush()
 
         # Try to reset
-        service = PasswordService(db_session)
-        result = service.reset_password(
+        result = password_service.reset_password(
             raw_token=raw_token,
             new_password="NewPassword789",
         )
@@ -608,176 +683,84 @@ class TestPasswordServiceResetPassword:
         assert result is False
 
 
-@pytest.mark.integration
-class TestChangePasswordEndpoint:
-    """Test POST /api/auth/change-password endpoint."""
-
-    def test_change_password_success(
-        self,
-        client: TestClient,
-        db_session: Session,
-    ):
-        """Verify password change with valid credentials."""
-        # Create user with known password
-        original_password = "OriginalPass123"
-        user = User(
-            username="endpoint_user",
-            email="endpoint@example.com",
-            hashed_password=hash_password(original_password),
-            token_version=1,
-        )
-        db_session.add(user)
-        db_session.commit()
-
-        # Get valid token
-        from jose import jwt
-
-        token_payload = {
-            "sub": str(user.id),
-            "type": "access",
-            "token_ver": 1,
-            "exp": datetime.utcnow() + timedelta(hours=1),
-        }
-        token = jwt.encode(token_payload, "test-secret-key", algorithm="HS256")
-
-        # Change password
-        response = client.post(
-            "/api/auth/change-password",
-            json={
-                "current_password": original_password,
-                "new_password": "NewPassword456",
-            },
-            headers={"Authorization": f"Bearer {token}"},
-        )
-
-        assert response.status_code == 200
-        assert "successfully" in response.json()["message"].lower()
-
-    def test_change_password_wrong_current(
-        self,
-        client: TestClient,
-        db_session: Session,
-    ):
-        """Verify rejection with wrong current password."""
-        user = User(
-            username="wrong_current_user",
-            email="wrongcurrent@example.com",
-            hashed_password=hash_password("CorrectPass123"),
-            token_version=1,
-        )
-        db_session.add(user)
-        db_session.commit()
+@pytest.fixture
+def endpoint_user(db_session: Session) -> User:
+    """User with password CorrectPass123 for the change-password endpoint tests."""
+    user = User(
+        username="endpoint_user",
+        email="endpoint@example.com",
+        hashed_password=_hashed("CorrectPass123"),
+        token_version=1,
+    )
+    db_session.add(user)
+    db_session.flush()
+    return user
 
-        from jose import jwt
 
-        token_payload = {
-            "sub": str(user.id),
-            "type": "access",
-            "token_ver": 1,
-            "exp": datetime.utcnow() + timedelta(hours=1),
-        }
-        token = jwt.encode(token_payload, "test-secret-key", algorithm="HS256")
+@pytest.fixture
+def endpoint_headers(endpoint_user: User) -> dict:
+    """Authorization headers for endpoint_user."""
+    token = create_jwt_token(endpoint_user.id, endpoint_user.username)
+    return {"Authorization": f"Bearer {token}"}
 
-        response = client.post(
-            "/api/auth/change-password",
-            json={
-                "current_password": "WrongPass123",
-                "new_password": "NewPassword456",
-            },
-            headers={"Authorization": f"Bearer {token}"},
-        )
 
-        assert response.status_code == 401
+CHANGE_PASSWORD_CASES = [
+    pytest.param("CorrectPass123", "NewPassword456", True, 200, id="success"),
+    pytest.param("WrongPass123", "NewPassword456", True, 401, id="wrong_current"),
+    pytest.param("CorrectPass123", "NewPassword456", False, 401, id="unauthenticated"),
+    pytest.param("CorrectPass123", "weak", True, 422, id="weak_password_rejected"),
+]
 
-    def test_change_password_unauthenticated(self, client: TestClient):
-        """Verify endpoint requires authentication."""
-        response = client.post(
-            "/api/auth/change-password",
-            json={
-                "current_password": "OldPass123",
-                "new_password": "NewPass456",
-            },
-        )
 
-        assert response.status_code == 401
+@pytest.mark.integration
+class TestChangePasswordEndpoint:
+    """Test POST /api/auth/change-password endpoint."""
 
-    def test_change_password_weak_password_rejected(
+    @pytest.mark.parametrize(
+        "current_password,new_password,authenticated,status_code", CHANGE_PASSWORD_CASES
+    )
+    def test_change_password(
         self,
         client: TestClient,
-        db_session: Session,
+        endpoint_headers: dict,
+        current_password: str,
+        new_password: str,
+        authenticated: bool,
+        status_code: int,
     ):
-        """Verify weak new password is rejected with 422."""
-        user = User(
-            username="weak_pass_user",
-            email="weakpass@example.com",
-            hashed_password=hash_password("CorrectPass123"),
-            token_version=1,
-        )
-        db_session.add(user)
-        db_session.commit()
-
-        from jose import jwt
-
-        token_payload = {
-            "sub": str(user.id),
-            "type": "access",
-            "token_ver": 1,
-            "exp": datetime.utcnow() + timedelta(hours=1),
-        }
-        token = jwt.encode(token_payload, "test-secret-key", algorithm="HS256")
-
+        """Verify password change succeeds only with auth, the right password, and a strong new one."""
         response = client.post(
             "/api/auth/change-password",
             json={
-                "current_password": "CorrectPass123",
-                "new_password": "weak",
+                "current_password": current_password,
+                "new_password": new_password,
             },
-            headers={"Authorization": f"Bearer {token}"},
+            headers=endpoint_headers if authenticated else {},
         )
 
-        assert response.status_code == 422
+        assert response.status_code == status_code
+        if status_code == 200:
+            assert b"successfully" in response.content.lower()
 
     def test_change_password_invalidates_old_token(
         self,
         client: TestClient,
-        db_session: Session,
+        endpoint_headers: dict,
     ):
         """Verify old token stops working after password change."""
-        user = User(
-            username="invalidate_user",
-            email="invalidate@example.com",
-            hashed_password=hash_password("OriginalPass123"),
-            token_version=1,
-        )
-        db_session.add(user)
-        db_session.commit()
-
-        from jose import jwt
-
-        token_payload = {
-            "sub": str(user.id),
-            "type": "access",
-            "token_ver": 1,
-            "exp": datetime.utcnow() + timedelta(hours=1),
-        }
-        old_token = jwt.encode(token_payload, "test-secret-key", algorithm="HS256")
-
         # Change password
         response = client.post(
             "/api/auth/change-password",
             json={
-                "current_password": "OriginalPass123",
+                "current_password": "CorrectPass123",
                 "new_password": "NewPassword456",
             },
-            headers={"Authorization": f"Bearer {old_token}"},
+            headers=endpoint_headers,
         )
         assert response.status_code == 200
 
         # Try to use old token
-        response = client.get(
-            "/api/auth/me",
-            headers={"Authorization": f"Bearer {old_token}"},
-        )
+        response = client.get("/api/auth/me", headers=endpoint_headers)
 
         assert response.status_code == 401
 
@@ -794,18 +777,18 @@ class TestForgotPasswordEndpoint:
         db_session: Session,
     ):
         """Verify reset email sent for existing user."""
-        mock_email_instance = MagicMock()
+        mock_email_instance = MagicMock(spec=["send_password_reset"])
         mock_email_class.return_value = mock_email_instance
         mock_email_instance.send_password_reset.return_value = True
 
         user = User(
             username="forgot_endpoint_user",
             email="forgotendpoint@example.com",
-            hashed_password=hash_password("SomePass123"),
+            hashed_password=UNVERIFIED_HASH,
             token_version=1,
         )
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()
 
         response = client.post(
             "/api/auth/forgot-password",
@@ -813,7 +796,7 @@ class TestForgotPasswordEndpoint:
         )
 
         assert response.status_code == 200
-        assert "password reset link" in response.json()["message"].lower()
+        assert b"password reset link" in response.content.lower()
 
     @patch("services.password_service.EmailService")
     def test_forgot_password_nonexistent_email_same_response(
@@ -829,7 +812,7 @@ class TestForgotPasswordEndpoint:
 
         # Should return 200 with same message
         assert response.status_code == 200
-        assert "password reset link" in response.json()["message"].lower()
+        assert b"password reset link" in response.content.lower()
 
     def test_forgot_password_invalid_email_format(self, client: TestClient):
         """Verify invalid email format is rejected."""
@@ -841,6 +824,39 @@ class TestForgotPasswordEndpoint:
         assert response.status_code == 422
 
 
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _reset_body(raw_token: str, new_password: str) -> bytes:
+    """Encode a reset-password request body once, at collection time."""
+    return json.dumps({"token": raw_token, "new_password": new_password}).encode()
+
+
+# (raw token, seeded token overrides or None for no token, request body, status)
+RESET_REJECTION_CASES = [
+    pytest.param(
+        "totally_invalid_token", None,
+        _reset_body("totally_invalid_token", "NewPassword789"), 400,
+        id="invalid_token",
+    ),
+    pytest.param(
+        "expired_endpoint_token", {"expires_at": FAR_PAST},
+        _reset_body("expired_endpoint_token", "NewPassword789"), 400,
+        id="expired_token",
+    ),
+    pytest.param(
+        "used_endpoint_token", {"used_at": FAR_PAST},
+        _reset_body("used_endpoint_token", "NewPassword789"), 400,
+        id="already_used_token",
+    ),
+    pytest.param(
+        "weak_reset_token", {},
+        _reset_body("weak_reset_token", "weak"), 422,
+        id="weak_password_rejected",
+    ),
+]
+
+
 @pytest.mark.integration
 class TestResetPasswordEndpoint:
     """Test POST /api/auth/reset-password endpoint."""
@@ -849,27 +865,11 @@ class TestResetPasswordEndpoint:
         self,
         client: TestClient,
         db_session: Session,
+        reset_user: User,
     ):
         """Verify password reset with valid token."""
-        user = User(
-            username="reset_endpoint_user",
-            email="resetendpoint@example.com",
-            hashed_password=hash_password("OldPass123"),
-            token_version=1,
-        )
-        db_session.add(user)
-        db_session.commit()
-
-        # Create valid token
         raw_token = "endpoint_reset_token_12345"
-        token_hash = hashlib.sha256(raw_token.encode()).hexdigest()
-        reset_token = PasswordResetToken(
-            user_id=user.id,
-            token_hash=token_hash,
-            expires_at=datetime.utcnow() + timedelta(hours=1),
-        )
-        db_session.add(reset_token)
-        db_session.commit()
+        _make_reset_token(db_session, reset_user, raw_token)
 
         response = client.post(
             "/api/auth/reset-password",
@@ -880,125 +880,29 @@ class TestResetPasswordEndpoint:
         )
 
         assert response.status_code == 200
-        assert "successfully" in response.json()["message"].lower()
-
-    def test_reset_password_invalid_token(self, client: TestClient):
-        """Verify reset fails with invalid token."""
-        response = client.post(
-            "/api/auth/reset-password",
-            json={
-                "token": "totally_invalid_token",
-                "new_password": "NewPassword789",
-            },
-        )
-
-        assert response.status_code == 400
+        assert b"successfully" in response.content.lower()
 
-    def test_reset_password_expired_token(
+    @pytest.mark.parametrize(
+        "raw_token,token_overrides,body,status_code", RESET_REJECTION_CASES
+    )
+    def test_reset_password_rejected(
         self,
         client: TestClient,
         db_session: Session,
+        reset_user: User,
+        raw_token: str,
+        token_overrides: Optional[dict],
+        body: bytes,
+        status_code: int,
     ):
-        """Verify reset fails with expired token."""
-        user = User(
-            username="expired_endpoint_user",
-            email="expiredendpoint@example.com",
-            hashed_password=hash_password("OldPass123"),
-            token_version=1,
-        )
-        db_session.add(user)
-        db_session.commit()
-
-        # Create expired token
-        raw_token = "expired_endpoint_token"
-        token_hash = hashlib.sha256(raw_token.encode()).hexdigest()
-        reset_token = PasswordResetToken(
-            user_id=user.id,
-            token_hash=token_hash,
-            expires_at=datetime.utcnow() - timedelta(hours=1),
-        )
-        db_session.add(reset_token)
-        db_session.commit()
-
-        response = client.post(
-            "/api/auth/reset-password",
-            json={
-                "token": raw_token,
-                "new_password": "NewPassword789",
-            },
-        )
-
-        assert response.status_code == 400
-
-    def test_reset_password_already_used_token(
-        self,
-        client: TestClient,
-        db_session: Session,
-    ):
-        """Verify reset fails with already-used token."""
-        user = User(
-            username="used_endpoint_user",
-            email="usedendpoint@example.com",
-            hashed_password=hash_password("OldPass123"),
-            token_version=1,
-        )
-        db_session.add(user)
-        db_session.commit()
-
-        # Create used token
-        raw_token = "used_endpoint_token"
-        token_hash = hashlib.sha256(raw_token.encode()).hexdigest()
-        reset_token = PasswordResetToken(
-            user_id=user.id,
-            token_hash=token_hash,
-            expires_at=datetime.utcnow() + timedelta(hours=1),
-            used_at=datetime.utcnow() - timedelta(minutes=30),
-        )
-        db_session.add(reset_token)
-        db_session.commit()
-
-        response = client.post(
-            "/api/auth/reset-password",
-            json={
-                "token": raw_token,
-                "new_password": "NewPassword789",
-            },
-        )
-
-        assert response.status_code == 400
-
-    def test_reset_password_weak_password_rejected(
-        self,
-        client: TestClient,
-        db_session: Session,
-    ):
-        """Verify weak password is rejected with 422."""
-        user = User(
-            username="weak_reset_user",
-            email="weakreset@example.com",
-            hashed_password=hash_password("OldPass123"),
-            token_version=1,
-        )
-        db_session.add(user)
-        db_session.commit()
-
-        raw_token = "weak_reset_token"
-        token_hash = hashlib.sha256(raw_token.encode()).hexdigest()
-        reset_token = PasswordResetToken(
-            user_id=user.id,
-            token_hash=token_hash,
-            expires_at=datetime.utcnow() + timedelta(hours=1),
-        )
-        db_session.add(reset_token)
-        db_session.commit()
+        """Verify reset is rejected for unknown, expired, or used tokens and weak passwords."""
+        if token_overrides is not None:
+            _make_reset_token(db_session, reset_user, raw_token, **token_overrides)
 
         response = client.post(
             "/api/auth/reset-password",
-            json={
-                "token": raw_token,
-                "new_password": "weak",
-            },
+            content=body,
+            headers=JSON_HEADERS,
         )
 
-        assert response.status_code == 422
-
+        assert response.status_code == status_code
@@ -2,6 +2,11 @@
 
 from datetime import datetime, timedelta
 
+import pytest
+
+
+pytestmark = pytest.mark.postgis
+
 
 def test_overview_integration_new_user_journey(client, db_session):
     """Test complete user journey: register -> first visit -> check overview."""
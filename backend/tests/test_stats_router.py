@@ -18,6 +18,9 @@ from schemas.stats import (
 )
 
 
+pytestmark = pytest.mark.postgis
+
+
 @pytest.mark.integration
 class TestStatsCountriesEndpoint:
     """Test GET /api/v1/stats/countries endpoint."""
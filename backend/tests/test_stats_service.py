@@ -11,6 +11,9 @@ from services.stats_service import StatsService
 from tests.fixtures.test_data import SAN_FRANCISCO, LOS_ANGELES, TOKYO
 
 
+pytestmark = pytest.mark.postgis
+
+
 @pytest.mark.integration
 class TestStatsServiceCountries:
     """Test StatsService.get_countries() method."""